@@ -3,18 +3,28 @@
 Programa principal para lectura de sensores TEMPer y registro de datos en un log rotativo.
 
 - Lee sensores TEMPer usando `temper_reader.get_medicion()`.
-- Registra la información en un log rotativo para no saturar el disco.
+- Registra la información en un log rotativo para no saturar el disco
+  (escrito desde un hilo en segundo plano).
 - Imprime por consola los resultados.
+
+Por defecto realiza una única lectura (pensado para cron). Con `--intervalo N`
+queda en ejecución y repite la lectura cada N segundos, reutilizando entre
+ciclos las conexiones, cachés y el manejador USB ya inicializados.
 """
 
+import argparse
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import signal
+import time
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from datetime import datetime
 
 from module.temper_reader import get_medicion
 from module.system_info import get_system_info
 from module.location_info import get_location_data  
-from module.json_builder import insert_into_db
+from module.json_builder import insert_many_into_db
 
 
 # Configuración del log rotativo
@@ -22,17 +32,86 @@ LOG_FILE = "temperatura.log"
 MAX_BYTES = 1_000_000  # 1 MB por archivo
 BACKUP_COUNT = 2       # Mantener hasta 5 archivos antiguos
 
+
+class FastRotatingFileHandler(RotatingFileHandler):
+    """`RotatingFileHandler` que evita consultar el sistema de ficheros en cada registro.
+
+    El `shouldRollover()` de la librería estándar comprueba con `os.path.exists`
+    e `os.path.isfile` el archivo de log en cada `emit()`. Aquí se resuelve
+    primero el caso habitual (el mensaje cabe en el archivo actual) solo con
+    `stream.tell()`, y únicamente se delega en la implementación original
+    cuando podría ser necesario rotar.
+    """
+
+    def shouldRollover(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes > 0:
+            msg = "%s\n" % self.format(record)
+            if self.stream.tell() + len(msg) < self.maxBytes:
+                return 0
+        return super().shouldRollover(record)
+
+
 logger = logging.getLogger("TemperLogger")
 logger.setLevel(logging.INFO)
 
-handler = RotatingFileHandler(LOG_FILE, maxBytes=MAX_BYTES, backupCount=BACKUP_COUNT, encoding="utf-8")
-formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+handler = FastRotatingFileHandler(LOG_FILE, maxBytes=MAX_BYTES, backupCount=BACKUP_COUNT, encoding="utf-8")
+# Con `datefmt` explícito la marca de tiempo se genera con un único strftime,
+# sin el paso adicional de formateo de milisegundos de `default_msec_format`
+formatter = logging.Formatter('%(asctime)s %(levelname)s %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
 handler.setFormatter(formatter)
-logger.addHandler(handler)
 
-
-def main():
-    """Función principal que lee sensores y guarda la información en el log."""
+# La escritura en disco se hace en un hilo aparte: el bucle principal solo
+# encola los registros y el listener los vuelca en el log rotativo.
+# El handler va en el logger raíz para que también lleguen al archivo los
+# avisos y errores de los módulos (`module.db_connection`, `module.json_builder`...).
+log_queue = queue.Queue(-1)
+logging.getLogger().addHandler(QueueHandler(log_queue))
+listener = QueueListener(log_queue, handler)
+listener.start()
+atexit.register(listener.stop)
+
+
+# Payload reutilizable por posición de sensor:
+# índice -> (metadata, location, ip, payload)
+_PAYLOADS: dict[int, tuple[dict, dict, str | None, dict]] = {}
+
+
+def get_payload(index: int, metadata: dict, system: dict, location: dict) -> dict:
+    """Devuelve el payload del sensor en la posición `index`, reutilizándolo entre ciclos.
+
+    `metadata` y `location` proceden de cachés (`get_cached_metadata()` y
+    `get_location_data()`), que devuelven el mismo objeto mientras no cambian,
+    así que basta comparar su identidad y la IP para saber si los campos fijos
+    siguen siendo válidos. El llamador actualiza "fecha_hora" y "temperatura";
+    el diccionario devuelto se sobrescribe en el siguiente ciclo.
+    """
+    ip = system["ip_maquina"]
+    cached = _PAYLOADS.get(index)
+    if cached is not None and cached[0] is metadata and cached[1] is location and cached[2] == ip:
+        return cached[3]
+
+    payload = {
+        "fecha_hora": None,
+        "nombre_sensor": metadata.get("product", "Desconocido"),
+        "numero_serie": metadata.get("serial_number"),
+        "ubicacion": location["ubicacion"],
+        "hostname_maquina": system["hostname"],
+        "ip_maquina": ip,
+        "id_maquina": system["id_maquina"],
+        "temperatura": None,
+        "humedad": None,
+        "bateria": None,
+        "cpd": location["cpd"],
+        "sala": location["sala"]
+    }
+    _PAYLOADS[index] = (metadata, location, ip, payload)
+    return payload
+
+
+def poll():
+    """Realiza un ciclo de lectura de sensores y guarda la información en el log y la DB."""
     try:
         # 1️ Información del sistema
         system = get_system_info(use_dynamic_ip=True)
@@ -49,40 +128,103 @@ def main():
             logger.warning("No se detectaron sensores TEMPer.")
             return
 
-        for sensor in mediciones:
+        # Todas las lecturas del ciclo comparten la misma marca de tiempo
+        fecha_hora = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        # Se consulta una sola vez si el nivel INFO está activo para no
+        # construir registros de log que luego se descartarían
+        log_lecturas = logger.isEnabledFor(logging.INFO)
+
+        payloads = []
+        for index, sensor in enumerate(mediciones):
             temp = sensor["temperature_c"]
-            metadata = sensor["metadata"]
-
-            # Construir payload (opcional)
-            payload = {
-                "fecha_hora": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "nombre_sensor": metadata.get("product", "Desconocido"),
-                "numero_serie": metadata.get("serial_number"),
-                "ubicacion": location["ubicacion"],
-                "hostname_maquina": system["hostname"],
-                "ip_maquina": system["ip_maquina"],
-                "id_maquina": system["id_maquina"],
-                "temperatura": round(temp, 2),
-                "humedad": None,
-                "bateria": None,
-                "cpd": location["cpd"],
-                "sala": location["sala"]
-            }
-
-            #msg = f"{payload['nombre_sensor']} (SN: {payload['numero_serie']}): {payload['temperatura']:.2f}°C"
-            #logger.info(msg)
-            logger.info(payload)
-
-            success = insert_into_db(payload)
-
-            if success:
-                logger.info(f"Payload insertado en DB: {payload['nombre_sensor']} | {payload['temperatura']:.2f}°C")
-            else:
-                logger.error(f"Error al insertar en DB: {payload['nombre_sensor']}")
+            temperatura = round(temp, 2)
+
+            payload = get_payload(index, sensor["metadata"], system, location)
+            payload["fecha_hora"] = fecha_hora
+            payload["temperatura"] = temperatura
+
+            if log_lecturas:
+                logger.info(
+                    "Lectura sensor=%s sn=%s t=%s°C",
+                    payload["nombre_sensor"], payload["numero_serie"], temperatura
+                )
+            payloads.append(payload)
+
+        # 4️ Inserción de todas las lecturas en un único lote
+        failed = insert_many_into_db(payloads)
+        if len(failed) < len(payloads):
+            logger.info("Payloads insertados en DB: %d", len(payloads) - len(failed))
+        for payload, error in failed:
+            logger.error(
+                "Error al insertar en DB: %s (SN: %s): %s",
+                payload["nombre_sensor"], payload["numero_serie"], error
+            )
 
     except Exception as e:
-        logger.error(f"Error al leer sensores: {e}")
+        logger.error("Error al leer sensores: %s", e)
+
+
+def _handle_sigterm(signum, frame):
+    """Convierte SIGTERM (p. ej. `systemctl stop`) en una parada ordenada."""
+    raise KeyboardInterrupt
+
+
+def positive_float(value: str) -> float:
+    """Tipo de argparse que acepta solo números estrictamente positivos."""
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{value}' no es un número")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"el intervalo debe ser mayor que 0, se recibió: {value}")
+    return number
+
+
+def main(interval: float | None = None):
+    """Función principal: ejecuta `poll()` una vez o de forma periódica.
+
+    En modo periódico SIGTERM se trata igual que Ctrl+C, de modo que al
+    detener el servicio se ejecutan los `atexit` (vaciado del log y cierre
+    del pool de conexiones).
+
+    Args:
+        interval (float | None): Segundos entre lecturas. Si es None o 0 se
+            realiza una única lectura y el programa termina.
+
+    Raises:
+        ValueError: Si `interval` es negativo.
+    """
+    if not interval:
+        poll()
+        return
+    if interval < 0:
+        raise ValueError(f"El intervalo debe ser mayor que 0, se encontró: {interval}")
+
+    signal.signal(signal.SIGTERM, _handle_sigterm)
+
+    logger.info("Iniciando lectura periódica cada %s s", interval)
+    next_run = time.monotonic()
+    try:
+        while True:
+            poll()
+            # Programación a ritmo fijo: el tiempo de lectura no acumula deriva
+            next_run += interval
+            now = time.monotonic()
+            if next_run < now:
+                # Ciclo retrasado: saltar los huecos perdidos en lugar de
+                # ejecutarlos seguidos
+                next_run += ((now - next_run) // interval + 1) * interval
+            time.sleep(next_run - now)
+    except KeyboardInterrupt:
+        logger.info("Lectura periódica detenida")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Lectura de sensores TEMPer")
+    parser.add_argument(
+        "--intervalo", type=positive_float, default=None,
+        help="Segundos entre lecturas; si se omite se realiza una única lectura"
+    )
+    args = parser.parse_args()
+    main(interval=args.intervalo)
@@ -2,8 +2,8 @@
 """
 Módulo de conexión a MariaDB.
 
-Este módulo carga credenciales desde un archivo JSON externo y establece una
-conexión con una base de datos MariaDB.
+Este módulo carga credenciales desde un archivo JSON externo y mantiene un
+pool de conexiones persistentes con una base de datos MariaDB.
 
 Estructura esperada del archivo config/credenciales.json:
 
@@ -20,10 +20,29 @@ Estructura esperada del archivo config/credenciales.json:
 Asegúrate de que el archivo exista y respete este formato.
 """
 
-import json
+import atexit
+import logging
 import os
 import mariadb
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+
+# orjson es opcional: si está instalado se usa para parsear JSON más rápido
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+
+logger = logging.getLogger(__name__)
+
+# Pool de conexiones compartido por todo el proceso (se crea bajo demanda).
+# El pool abre todas sus conexiones al crearse y `poll()` solo usa una a la vez.
+POOL_NAME = "temper"
+POOL_SIZE = 1
+_POOL = None
+
+# Caché de credenciales ya leídas: ruta -> (mtime, credenciales)
+_CREDENTIALS_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
 
 
 def load_credentials(config_path: str = "config/credenciales.json") -> Dict[str, Any]:
@@ -43,6 +62,9 @@ def load_credentials(config_path: str = "config/credenciales.json") -> Dict[str,
     }
     ```
 
+    El resultado se guarda en caché y solo se vuelve a leer el archivo si
+    cambia su fecha de modificación.
+
     Args:
         config_path (str): Ruta al archivo de credenciales.
             Por defecto: "config/credenciales.json".
@@ -57,26 +79,42 @@ def load_credentials(config_path: str = "config/credenciales.json") -> Dict[str,
     """
     full_path = os.path.abspath(config_path)
 
-    if not os.path.exists(full_path):
+    try:
+        mtime = os.stat(full_path).st_mtime
+    except FileNotFoundError:
         raise FileNotFoundError(f"Credenciales no encontradas: {full_path}")
 
-    with open(full_path, 'r', encoding='utf-8') as f:
-        return json.load(f)["database"]
+    cached = _CREDENTIALS_CACHE.get(full_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
 
+    with open(full_path, 'rb') as f:
+        creds = _loads(f.read())["database"]
 
-def get_db_connection():
-    """Establece y devuelve una conexión activa a MariaDB.
+    _CREDENTIALS_CACHE[full_path] = (mtime, creds)
+    return creds
 
-    Utiliza las credenciales obtenidas por `load_credentials()`.  
-    Si ocurre un error, devuelve `None` en lugar de lanzar una excepción.
+
+def get_connection_pool():
+    """Devuelve el pool de conexiones a MariaDB, creándolo en la primera llamada.
+
+    Las credenciales se leen una sola vez, al crear el pool. Las conexiones
+    del pool mantienen el socket abierto entre inserciones, evitando repetir
+    el handshake TCP/TLS y la autenticación en cada llamada. El pool se
+    cierra automáticamente al terminar el proceso.
 
     Returns:
-        mariadb.Connection | None: Conexión activa o None si falla.
-    """
-    creds = load_credentials()
+        mariadb.ConnectionPool: Pool de conexiones compartido.
 
-    try:
-        conn = mariadb.connect(
+    Raises:
+        mariadb.Error: Si no se puede crear el pool.
+    """
+    global _POOL
+    if _POOL is None:
+        creds = load_credentials()
+        _POOL = mariadb.ConnectionPool(
+            pool_name=POOL_NAME,
+            pool_size=POOL_SIZE,
             host=creds["host"],
             port=creds["port"],
             user=creds["user"],
@@ -84,9 +122,49 @@ def get_db_connection():
             database=creds["database"],
             autocommit=True
         )
-        print("Conexión a MariaDB exitosa.")
-        return conn
+    return _POOL
+
+
+def close_connection_pool():
+    """Cierra el pool de conexiones compartido, si se llegó a crear."""
+    global _POOL
+    if _POOL is not None:
+        pool, _POOL = _POOL, None
+        try:
+            pool.close()
+        except mariadb.Error as e:
+            logger.error("Error cerrando el pool de MariaDB: %s", e)
+
+
+atexit.register(close_connection_pool)
+
 
-    except mariadb.Error as e:
-        print(f"Error conectando a MariaDB: {e}")
-        return None
+def get_db_connection():
+    """Obtiene una conexión activa a MariaDB desde el pool compartido.
+
+    Utiliza el pool creado por `get_connection_pool()`. Al cerrar la conexión
+    devuelta (`conn.close()` o bloque `with`) esta vuelve al pool en lugar de
+    cerrar el socket.  
+    Si el pool no puede entregar una conexión válida (por ejemplo, tras un
+    reinicio de MariaDB el pool se queda sin conexiones) se descarta y se
+    reconstruye una vez antes de rendirse.  
+    Si ocurre un error, devuelve `None` en lugar de lanzar una excepción.
+
+    Returns:
+        mariadb.Connection | None: Conexión activa o None si falla.
+    """
+    error = None
+    for _ in range(2):
+        try:
+            conn = get_connection_pool().get_connection()
+            if conn is not None:
+                logger.debug("Conexión a MariaDB exitosa.")
+                return conn
+            error = "pool sin conexiones libres"
+        except mariadb.Error as e:
+            error = e
+        # Pool inservible: se cierra para que la siguiente llamada lo recree
+        close_connection_pool()
+
+    logger.error("Error conectando a MariaDB: %s", error)
+    return None
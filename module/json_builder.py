@@ -1,9 +1,30 @@
 # module/json_builder.py
 import json
+import logging
 import mariadb
 from datetime import datetime
+from operator import itemgetter
 from .db_connection import get_db_connection
 
+
+logger = logging.getLogger(__name__)
+
+# Columnas de `telemetria_sensores` en el orden de los parámetros del INSERT
+COLUMNS = (
+    "fecha_hora", "nombre_sensor", "numero_serie", "ubicacion",
+    "hostname_maquina", "ip_maquina", "id_maquina", "temperatura",
+    "humedad", "bateria", "cpd", "sala"
+)
+
+INSERT_SQL = (
+    f"INSERT INTO telemetria_sensores ({', '.join(COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(COLUMNS))})"
+)
+
+# Extrae en C la tupla de valores de un payload, en el orden de COLUMNS
+_GET_VALUES = itemgetter(*COLUMNS)
+
+
 def insert_into_db(telemetry_data: dict) -> bool:
     """Inserta un registro de telemetría en la tabla `telemetria_sensores`.
 
@@ -51,43 +72,67 @@ def insert_into_db(telemetry_data: dict) -> bool:
         ...     "sala": "Sala A"
         ... }
         >>> insert_into_db(telemetry)
-        Registro insertado: Sensor_A1 | 23.5°C
         True
     """
+    return not insert_many_into_db([telemetry_data])
+
+
+def insert_many_into_db(payloads: list[dict]) -> list[tuple[dict, str]]:
+    """Inserta varios registros de telemetría en una única operación.
+
+    Todas las filas se envían con `cursor.executemany()` sobre un cursor
+    preparado de una misma conexión, dentro de una transacción confirmada con
+    un solo `commit()`, de modo que N lecturas suponen un único viaje de ida y
+    vuelta a MariaDB. Si el lote falla se deshace y se reintenta fila a fila,
+    para que un registro inválido no impida guardar el resto.
+
+    Args:
+        payloads (list[dict]): Lista de diccionarios con la misma estructura
+            que espera `insert_into_db()`.
+
+    Returns:
+        list[tuple[dict, str]]: Registros que no pudieron insertarse, cada uno
+        con el mensaje de error correspondiente. Lista vacía si se insertaron
+        todos.
+    """
+    if not payloads:
+        return []
+
     conn = get_db_connection()
     if not conn:
-        return False
+        return [(p, "sin conexión a MariaDB") for p in payloads]
 
-    cursor = conn.cursor()
+    rows = [_GET_VALUES(p) for p in payloads]
+    failed = []
     try:
-        query = """
-        INSERT INTO telemetria_sensores 
-        (fecha_hora, nombre_sensor, numero_serie, ubicacion, hostname_maquina, 
-         ip_maquina, id_maquina, temperatura, humedad, bateria, cpd, sala)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        values = (
-            telemetry_data["fecha_hora"],
-            telemetry_data["nombre_sensor"],
-            telemetry_data["numero_serie"],
-            telemetry_data["ubicacion"],
-            telemetry_data["hostname_maquina"],
-            telemetry_data["ip_maquina"],
-            telemetry_data["id_maquina"],
-            telemetry_data["temperatura"],
-            telemetry_data["humedad"],
-            telemetry_data["bateria"],
-            telemetry_data["cpd"],
-            telemetry_data["sala"]
-        )
-        cursor.execute(query, values)
-        conn.commit()
-        print(f"Registro insertado: {telemetry_data['nombre_sensor']} | {telemetry_data['temperatura']}°C")
-        return True
+        # Cursor preparado: el servidor analiza INSERT_SQL una vez y el resto
+        # de filas se envían con el protocolo binario
+        cursor = conn.cursor(prepared=True)
+        try:
+            try:
+                conn.begin()
+                cursor.executemany(INSERT_SQL, rows)
+                conn.commit()
+                logger.debug("Registros insertados: %d", len(rows))
+            except mariadb.Error as e:
+                logger.warning("Error al insertar el lote, reintentando fila a fila: %s", e)
+                conn.rollback()
+                for payload, row in zip(payloads, rows):
+                    try:
+                        cursor.execute(INSERT_SQL, row)
+                    except mariadb.Error as e:
+                        failed.append((payload, str(e)))
+        finally:
+            cursor.close()
     except mariadb.Error as e:
-        print(f"Error al insertar: {e}")
-        return False
+        # Error de conexión durante el lote o al deshacerlo: no se guardó nada
+        logger.error("Error al insertar: %s", e)
+        failed = [(p, str(e)) for p in payloads]
     finally:
-        cursor.close()
-        conn.close()
-
+        # Devolver la conexión al pool; un fallo aquí no afecta a las filas
+        # ya confirmadas
+        try:
+            conn.close()
+        except mariadb.Error as e:
+            logger.warning("Error devolviendo la conexión al pool: %s", e)
+    return failed
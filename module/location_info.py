@@ -1,10 +1,22 @@
-import json
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+
+# orjson es opcional: si está instalado se usa para parsear JSON más rápido
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+# Caché de configuraciones ya validadas: ruta -> (mtime, datos)
+_CONFIG_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
 
 def get_location_data(config_path: str = "config/config.json") -> Dict[str, Any]:
     """Carga los datos de ubicación y offset de calibración desde un JSON de configuración.
 
+    El resultado se guarda en caché y solo se vuelve a leer el archivo si
+    cambia su fecha de modificación.
+
     Args:
         config_path (str): Ruta al archivo JSON de configuración.
 
@@ -22,11 +34,17 @@ def get_location_data(config_path: str = "config/config.json") -> Dict[str, Any]
         ValueError: Si 'offset_celsius' no es un número.
     """
     full_path = os.path.abspath(config_path)
-    if not os.path.exists(full_path):
+    try:
+        mtime = os.stat(full_path).st_mtime
+    except FileNotFoundError:
         raise FileNotFoundError(f"Archivo de configuración no encontrado: {full_path}")
 
-    with open(full_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    cached = _CONFIG_CACHE.get(full_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(full_path, "rb") as f:
+        data = _loads(f.read())
 
     required_keys = ["ubicacion", "cpd", "sala", "offset_celsius"]
     for key in required_keys:
@@ -39,4 +57,5 @@ def get_location_data(config_path: str = "config/config.json") -> Dict[str, Any]
     except (TypeError, ValueError):
         raise ValueError(f"El valor de 'offset_celsius' debe ser numérico, se encontró: {data['offset_celsius']}")
 
+    _CONFIG_CACHE[full_path] = (mtime, data)
     return data
@@ -12,14 +12,35 @@ Estas utilidades pueden ser usadas para registro, auditoría,
 identificación de dispositivos o diagnósticos.
 """
 
+import functools
 import socket
+import struct
+import time
 import uuid
 import platform
 
+try:
+    import fcntl  # Solo disponible en sistemas Unix
+except ImportError:
+    fcntl = None
 
+
+# Segundos durante los que se reutiliza la IP obtenida por `get_ip()`
+IP_CACHE_TTL = 300
+
+# ioctl de Linux para leer la dirección IPv4 de una interfaz
+SIOCGIFADDR = 0x8915
+
+# Última IP obtenida: (instante monotónico, ip)
+_IP_CACHE: tuple[float, str] | None = None
+
+
+@functools.lru_cache(maxsize=1)
 def get_hostname() -> str:
     """Obtiene el hostname del sistema.
 
+    El valor se calcula una sola vez por proceso.
+
     Returns:
         str: Nombre de host configurado en el sistema operativo.
 
@@ -30,11 +51,44 @@ def get_hostname() -> str:
     return socket.gethostname()
 
 
+def _get_default_route_ip() -> str | None:
+    """Obtiene la IP de la interfaz de la ruta por defecto leyendo `/proc/net/route`.
+
+    Solo funciona en Linux; no necesita conectividad externa ni DNS.
+
+    Returns:
+        str | None: IP de la interfaz, o None si no puede determinarse.
+    """
+    if fcntl is None:
+        return None
+    try:
+        with open("/proc/net/route", "r") as f:
+            next(f)  # cabecera
+            for line in f:
+                fields = line.split()
+                # Destino 0.0.0.0 con la ruta activa (RTF_UP): ruta por defecto
+                if fields[1] == "00000000" and int(fields[3], 16) & 1:
+                    iface = fields[0]
+                    break
+            else:
+                return None
+
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            ifreq = fcntl.ioctl(s.fileno(), SIOCGIFADDR, struct.pack("256s", iface[:15].encode()))
+        return socket.inet_ntoa(ifreq[20:24])
+    except (OSError, ValueError, IndexError, StopIteration):
+        return None
+
+
 def get_ip() -> str | None:
     """Obtiene la dirección IP local (no loopback).
 
-    Esta función crea un socket UDP "falso" hacia un servidor externo (8.8.8.8),
-    sin enviar datos, solo para que el sistema determine la IP de salida.
+    En Linux toma la IP de la interfaz de la ruta por defecto
+    (`_get_default_route_ip()`). Si no es posible, crea un socket UDP "falso"
+    hacia un servidor externo (8.8.8.8), sin enviar datos, solo para que el
+    sistema determine la IP de salida.
+    El resultado se reutiliza durante `IP_CACHE_TTL` segundos; los fallos
+    no se guardan, para reintentar en la siguiente llamada.
 
     Returns:
         str | None: IP local del equipo (por ejemplo "192.168.1.23").
@@ -44,21 +98,32 @@ def get_ip() -> str | None:
         >>> get_ip()
         '192.168.0.14'
     """
-    try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        ip = s.getsockname()[0]
-        s.close()
-        return ip
-    except Exception:
-        return None
+    global _IP_CACHE
+    now = time.monotonic()
+    if _IP_CACHE is not None and now - _IP_CACHE[0] < IP_CACHE_TTL:
+        return _IP_CACHE[1]
+
+    ip = _get_default_route_ip()
+    if ip is None:
+        try:
+            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            s.connect(("8.8.8.8", 80))
+            ip = s.getsockname()[0]
+            s.close()
+        except Exception:
+            return None
+
+    _IP_CACHE = (now, ip)
+    return ip
 
 
+@functools.lru_cache(maxsize=1)
 def get_machine_id() -> str | None:
     """Obtiene un identificador único de la máquina.
 
     Intenta leer `/etc/machine-id` (Linux).  
     Si falla, usa el UUID basado en la MAC (`uuid.getnode()`), común en Windows y macOS.
+    El valor se calcula una sola vez por proceso.
 
     Returns:
         str | None: Machine ID si está disponible, o None si no se puede obtener.
@@ -9,15 +9,73 @@ medida por cada uno.
 
 Funciones principales:
 - get_device_metadata(): Obtiene información del dispositivo USB.
+- get_cached_metadata(): Igual que la anterior, con caché entre lecturas.
 - get_medicion(): Lee temperatura de todos los dispositivos TEMPer detectados.
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from temperusb import TemperHandler
+from temperusb.temper import VIDPIDS
 import usb.core
 import usb.util
 
 
+# Metadata USB por dispositivo: (idVendor, idProduct, bus, address) -> dict
+_META_CACHE: dict[tuple, dict] = {}
+
+# TemperHandler compartido entre ciclos y los sensores que veía al crearse
+# (se re-enumera si cambian los sensores conectados o tras un error USB)
+_HANDLER = None
+_HANDLER_DEVICES: frozenset = frozenset()
+
+
+def _scan_devices() -> frozenset:
+    """Devuelve (idVendor, idProduct, bus, address) de cada TEMPer conectado.
+
+    Solo recorre los descriptores de dispositivo que ya conoce libusb, sin
+    abrir los sensores, por lo que es mucho más barato que crear un
+    `TemperHandler`.
+    """
+    found = usb.core.find(
+        find_all=True,
+        custom_match=lambda d: (d.idVendor, d.idProduct) in VIDPIDS
+    )
+    return frozenset((d.idVendor, d.idProduct, d.bus, d.address) for d in found)
+
+
+def _get_handler() -> TemperHandler:
+    """Devuelve el `TemperHandler` compartido, recreándolo si cambian los sensores."""
+    global _HANDLER, _HANDLER_DEVICES
+    present = _scan_devices()
+    if _HANDLER is None or present != _HANDLER_DEVICES:
+        _HANDLER = TemperHandler()
+        _HANDLER_DEVICES = present
+        # Olvidar la metadata de sensores desconectados: su dirección USB
+        # puede reasignarse después a otro sensor
+        for key in _META_CACHE.keys() - present:
+            del _META_CACHE[key]
+    return _HANDLER
+
+
+# Metadata devuelta cuando el driver no expone el dispositivo USB (solo lectura)
+_EMPTY_META = {
+    "vendor_id": None,
+    "product_id": None,
+    "manufacturer": None,
+    "product": None,
+    "serial_number": 'Desconocido'
+}
+
+
+def _safe_str(dev, index) -> str | None:
+    """Lee un descriptor de cadena USB, devolviendo None si no es posible."""
+    try:
+        return usb.util.get_string(dev, index)
+    except (usb.core.USBError, ValueError, NotImplementedError):
+        return None
+
+
 def get_device_metadata(device) -> dict:
     """Obtiene la metadata del dispositivo USB TEMPer.
 
@@ -55,37 +113,55 @@ def get_device_metadata(device) -> dict:
             "serial_number": "A1B2C3D4"
         }
     """
-    metadata = {}
     try:
-        metadata["vendor_id"] = hex(device._device.idVendor)
-        metadata["product_id"] = hex(device._device.idProduct)
+        dev = device._device
+        return {
+            "vendor_id": hex(dev.idVendor),
+            "product_id": hex(dev.idProduct),
+            "manufacturer": _safe_str(dev, dev.iManufacturer),
+            "product": _safe_str(dev, dev.iProduct),
+            "serial_number": _safe_str(dev, dev.iSerialNumber) or 'Desconocido'
+        }
+    except AttributeError:
+        # Algunas versiones del driver no exponen _device
+        return _EMPTY_META
 
-        try:
-            metadata["manufacturer"] = usb.util.get_string(device._device, device._device.iManufacturer)
-        except:
-            metadata["manufacturer"] = None
 
-        try:
-            metadata["product"] = usb.util.get_string(device._device, device._device.iProduct)
-        except:
-            metadata["product"] = None
+def get_cached_metadata(device) -> dict:
+    """Devuelve la metadata del dispositivo reutilizando la de ciclos anteriores.
 
-        try:
-            serial = usb.util.get_string(device._device, device._device.iSerialNumber)
-            metadata["serial_number"] = serial if serial else 'Desconocido'
-        except:
-            metadata["serial_number"] = 'Desconocido'
+    Los descriptores USB (fabricante, producto, número de serie) no cambian
+    mientras el sensor siga conectado en el mismo puerto, así que solo se
+    consultan con `get_device_metadata()` hasta obtener una lectura completa.
+    Si algún descriptor existente no pudo leerse (fallo transitorio) no se
+    guarda en caché y se reintenta en la siguiente llamada. Los dispositivos
+    que no exponen `_device` no pueden identificarse y tampoco se guardan.
 
-    except AttributeError:
-        # Algunas versiones del driver no exponen _device
-        metadata = {
-            "vendor_id": None,
-            "product_id": None,
-            "manufacturer": None,
-            "product": None,
-            "serial_number": 'Desconocido'
-        }
+    Args:
+        device: Objeto de dispositivo proporcionado por `TemperHandler().get_devices()`.
 
+    Returns:
+        dict: Metadata con los mismos campos que `get_device_metadata()`.
+    """
+    try:
+        dev = device._device
+        key = (dev.idVendor, dev.idProduct, dev.bus, dev.address)
+    except AttributeError:
+        return get_device_metadata(device)
+
+    metadata = _META_CACHE.get(key)
+    if metadata is not None:
+        return metadata
+
+    metadata = get_device_metadata(device)
+    # Un índice 0 indica que el dispositivo no tiene ese descriptor
+    complete = (
+        (not dev.iManufacturer or metadata["manufacturer"] is not None)
+        and (not dev.iProduct or metadata["product"] is not None)
+        and (not dev.iSerialNumber or metadata["serial_number"] != 'Desconocido')
+    )
+    if complete:
+        _META_CACHE[key] = metadata
     return metadata
 
 
@@ -94,9 +170,17 @@ def get_medicion(offset_celsius: float = -6.14) -> list[dict]:
 
     Usa `TemperHandler()` para detectar automáticamente todos los sensores TEMPer
     conectados. Para cada dispositivo:
-      - Obtiene su metadata USB mediante `get_device_metadata()`.
+      - Obtiene su metadata USB mediante `get_cached_metadata()`.
       - Lee la temperatura corregida con un offset configurable.
 
+    El `TemperHandler` se reutiliza entre llamadas; solo se vuelve a crear
+    cuando cambia el conjunto de sensores conectados (conexión o desconexión
+    en caliente) o tras un error USB.
+
+    Con varios sensores las lecturas de temperatura se lanzan en paralelo (un
+    hilo por sensor), de modo que el tiempo total no crece con el número de
+    dispositivos; con uno solo se lee directamente.
+
     Args:
         offset_celsius (float): Corrección aplicada a la lectura del sensor.
             Algunos sensores TEMPer presentan un error sistemático que se ajusta
@@ -126,15 +210,33 @@ def get_medicion(offset_celsius: float = -6.14) -> list[dict]:
         - Si no hay sensores conectados, devuelve una lista vacía.
         - La temperatura devuelta ya incluye la corrección del offset.
     """
-    handler = TemperHandler()
-    devices = handler.get_devices()
+    global _HANDLER
+
+    try:
+        devices = _get_handler().get_devices()
+
+        if not devices:
+            return []
+
+        metadata = [get_cached_metadata(device) for device in devices]
+
+        if len(devices) == 1:
+            temperatures = [devices[0].get_temperature()]
+        else:
+            # Cada lectura bloquea en una transferencia USB: se solapan entre sensores
+            with ThreadPoolExecutor(max_workers=len(devices)) as executor:
+                temperatures = list(executor.map(lambda d: d.get_temperature(), devices))
+    except usb.core.USBError:
+        # Dispositivo desconectado o cambiado: forzar nueva enumeración
+        _HANDLER = None
+        raise
 
     output = []
 
-    for device in devices:
+    for meta, temperature in zip(metadata, temperatures):
         data = {
-            "metadata": get_device_metadata(device),
-            "temperature_c": device.get_temperature() + offset_celsius
+            "metadata": meta,
+            "temperature_c": temperature + offset_celsius
         }
         output.append(data)
     #print(output)